@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import math
 
 
@@ -46,38 +47,149 @@ def sine_in_out(t):
     return -(math.cos(math.pi * t) - 1) / 2
 
 
-def interpolate_color(start_color, end_color, progress):
-    start_h, start_s, start_v = start_color
-    end_h, end_s, end_v = end_color
+def sine_in_out_fast(t):
+    # Smoothstep: within about 1% of sine_in_out, without calling math.cos
+    return t * t * (3 - 2 * t)
 
-    # Correct hue interpolation
-    if end_h < start_h:
-        end_h += 360
-    interpolated_h = (start_h + (end_h - start_h) * progress) % 360
 
-    # Interpolate saturation and value
-    interpolated_s = start_s + (end_s - start_s) * progress
-    interpolated_v = start_v + (end_v - start_v) * progress
+_EASERS = {
+    "linear": linear,
+    "quadratic_in": quadratic_in,
+    "quadratic_out": quadratic_out,
+    "quadratic_in_out": quadratic_in_out,
+    "cubic_in": cubic_in,
+    "cubic_out": cubic_out,
+    "cubic_in_out": cubic_in_out,
+    "sine_in": sine_in,
+    "sine_out": sine_out,
+    "sine_in_out": sine_in_out,
+    "sine_in_out_fast": sine_in_out_fast,
+}
 
-    return (int(interpolated_h), int(interpolated_s), int(interpolated_v))
 
+def interpolate_color(start_color, end_color, progress):
+    return interpolate_colors(start_color, end_color, [progress])[0]
 
-async def interpolate_color_over_time(
-    start_color, end_color, duration, easing_func="linear"
-):
-    easing_function = globals()[easing_func]
-    start_time = asyncio.get_event_loop().time()
 
-    while True:
-        current_time = asyncio.get_event_loop().time()
-        progress = (current_time - start_time) / duration
+def interpolate_colors(start_color, end_color, progresses):
+    start_h, start_s, start_v = start_color
+    end_h, end_s, end_v = end_color
 
-        if progress >= 1:
+    # The deltas are the same for every frame, so work them out once.
+    # Hue wraps around, so take the shorter way round the color wheel,
+    # going forwards when both ways are 180 degrees.
+    delta_h = 180 - (start_h - end_h + 180) % 360
+    delta_s = end_s - start_s
+    delta_v = end_v - start_v
+
+    # Round to the nearest integer rather than truncating, so the color
+    # steps evenly and a hue just under 360 wraps to 0 instead of 359
+    return [
+        (
+            int((start_h + delta_h * progress) % 360 + 0.5) % 360,
+            int(start_s + delta_s * progress + 0.5),
+            int(start_v + delta_v * progress + 0.5),
+        )
+        for progress in progresses
+    ]
+
+
+def color_ramp(start_color, end_color, duration, easing_func="linear", fps=10):
+    # Looping shows often repeat the same transition, so identical ramps are
+    # built once and shared. Colors may be passed as lists, which can't be cached.
+    return _color_ramp(tuple(start_color), tuple(end_color), duration, easing_func, fps)
+
+
+@functools.lru_cache(maxsize=128)
+def _color_ramp(start_color, end_color, duration, easing_func, fps):
+    easing_function = _EASERS.get(easing_func)
+    if easing_function is None:
+        raise ValueError(f"Easing type '{easing_func}' not found.")
+    frame_count = duration * fps
+    progresses = [
+        easing_function(frame / frame_count) for frame in range(math.ceil(frame_count))
+    ]
+
+    # Finish on exactly the end color, however few frames the ramp has
+    return (*interpolate_colors(start_color, end_color, progresses), end_color)
+
+
+async def stream_over_time(frames, fps=10):
+    frame_duration = 1 / fps
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    last_frame = len(frames) - 1
+    frame = 0
+
+    while frame <= last_frame:
+        yield frames[frame]
+
+        # The final frame lands on the end of the transition, so stop there
+        if frame == last_frame:
             break
 
-        eased_progress = easing_function(progress)
-        current_color = interpolate_color(start_color, end_color, eased_progress)
+        # Schedule against the start time so slow lights don't make the
+        # transition drift, and skip frames we've already fallen behind on,
+        # except for the final frame, which is always sent.
+        elapsed = loop.time() - start_time
+        current_frame = math.ceil(elapsed / frame_duration)
+        frame = min(max(frame + 1, current_frame), last_frame)
+        await asyncio.sleep(max(0, frame * frame_duration - elapsed))
+
+
+async def stream_to_lights(lights, frames, fps=10):
+    # Each light only holds on to the newest color it hasn't sent yet, so
+    # a slow light drops frames instead of holding back the others
+    queues = [asyncio.Queue(maxsize=1) for _ in lights]
+    tasks = [
+        asyncio.create_task(_queue_frames(queues, frames, fps)),
+        *[
+            asyncio.create_task(_send_queued_colors(light, queue))
+            for light, queue in zip(lights, queues)
+        ],
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _queue_frames(queues, frames, fps):
+    last_color = None
+    async for color in stream_over_time(frames, fps):
+        # Neighboring frames often round to the same color; don't resend it
+        if color == last_color:
+            continue
+        last_color = color
+        for queue in queues:
+            _replace_queued(queue, (color, False))
+
+    # Mark whatever is still waiting as the last color, so it's sent
+    # before the light stops, rather than being replaced
+    for queue in queues:
+        color, _ = queue.get_nowait() if queue.full() else (None, True)
+        queue.put_nowait((color, True))
+
+
+def _replace_queued(queue, item):
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+async def _send_queued_colors(light, queue):
+    while True:
+        color, last = await queue.get()
+        if color is not None:
+            await light.set_color(*color)
+        if last:
+            return
 
-        yield current_color
 
-        await asyncio.sleep(0.1)
+async def interpolate_color_over_time(
+    start_color, end_color, duration, easing_func="linear", fps=10
+):
+    frames = color_ramp(start_color, end_color, duration, easing_func, fps)
+    async for color in stream_over_time(frames, fps):
+        yield color
@@ -4,6 +4,7 @@ from kasa import SmartBulb
 class KasaLight:
     def __init__(self, host):
         self.light = SmartBulb(host)
+        self._updated = False
 
     async def turn_on(self):
         await self.light.turn_on()
@@ -12,5 +13,11 @@ class KasaLight:
         await self.light.turn_off()
 
     async def set_color(self, hue, saturation, value):
-        await self.light.update()
+        await self._update_once()
         await self.light.set_hsv(hue, saturation, value)
+
+    async def _update_once(self):
+        # set_hsv needs the bulb's device info, which only has to be fetched once
+        if not self._updated:
+            await self.light.update()
+            self._updated = True
@@ -13,14 +13,23 @@ class LightAction(Enum):
 
 
 class Effect:
+    __slots__ = ("repeat",)
+
     def __init__(self, repeat=1):
         self.repeat = repeat
 
     async def run(self):
         raise NotImplementedError
 
+    def _repetitions(self):
+        if self.repeat is None:
+            return itertools.repeat(None)
+        return itertools.repeat(None, self.repeat)
+
 
 class SoundEffect(Effect):
+    __slots__ = ("sound_file", "player")
+
     def __init__(
         self,
         sound_file,
@@ -32,38 +41,60 @@ class SoundEffect(Effect):
         self.player = player
 
     async def run(self):
-        for _ in range(self.repeat) if self.repeat is not None else itertools.count():
+        for _ in self._repetitions():
             await self.player.play_sound(self.sound_file)
 
 
 class LightEffect(Effect):
+    __slots__ = ("effect",)
+
     def __init__(self, effect, repeat=1):
         super().__init__(repeat)
         self.effect = effect
 
     async def run(self):
-        for _ in range(self.repeat) if self.repeat is not None else itertools.count():
+        for _ in self._repetitions():
             await self.effect()
 
 
+class DelayEffect(Effect):
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds, repeat=1):
+        super().__init__(repeat)
+        self.seconds = seconds
+
+    async def run(self):
+        for _ in self._repetitions():
+            await asyncio.sleep(self.seconds)
+
+
 class CustomEffect(Effect):
-    def __init__(self, func, *args, **kwargs):
+    __slots__ = ("func", "args", "kwargs", "blocking")
+
+    def __init__(self, func, *args, blocking=True, **kwargs):
         super().__init__(repeat=1)
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.blocking = blocking
 
     async def run(self):
         await self._run_custom_effect()
 
     async def _run_custom_effect(self):
-        await asyncio.to_thread(self._execute_func)
+        if self.blocking:
+            await asyncio.to_thread(self._execute_func)
+        else:
+            self._execute_func()
 
     def _execute_func(self):
         self.func(*self.args, **self.kwargs)
 
 
 class Section(Effect):
+    __slots__ = ("effects", "parallel", "name")
+
     def __init__(self, effects, parallel=False, repeat=1, name=None):
         super().__init__(repeat)
         self.effects = effects
@@ -73,16 +104,25 @@ class Section(Effect):
     async def run(
         self,
     ):
-        repeat_count = itertools.count() if self.repeat is None else range(self.repeat)
-        for _ in repeat_count:
+        leaves = self._collect_parallel_leaves() if self.parallel else None
+        for _ in self._repetitions():
             if self.parallel:
-                await asyncio.gather(
-                    *[self._run_effect(effect) for effect in self.effects]
-                )
+                await asyncio.gather(*[self._run_effect(effect) for effect in leaves])
             else:
                 for effect in self.effects:
                     await self._run_effect(effect)
 
+    def _collect_parallel_leaves(self):
+        # Nested parallel sections that run once can be gathered in one batch
+        # with this section's own effects, rather than one gather per level.
+        leaves = []
+        for effect in self.effects:
+            if isinstance(effect, Section) and effect.parallel and effect.repeat == 1:
+                leaves.extend(effect._collect_parallel_leaves())
+            else:
+                leaves.append(effect)
+        return leaves
+
     async def _run_effect(self, effect):
         if isinstance(effect, Section) and effect.repeat is None:
             task = asyncio.create_task(effect.run())
@@ -99,6 +139,7 @@ class SpecialEffect:
         self.effects = []
         self.named_effects = {}
         self._current_section = None
+        self._default_player = None
 
     @contextmanager
     def section(self, name=None, parallel=None, repeat=1):
@@ -121,11 +162,8 @@ class SpecialEffect:
         yield self
         self._current_section = previous_section
 
-        if previous_section:
-            if new_section not in previous_section.effects:
-                previous_section.effects.append(new_section)
-        elif new_section not in self.effects:
-            self.effects.append(new_section)
+        # new_section was just built, so it can't already be scheduled
+        self._add_effect(new_section)
 
     def add_light(self, name, light):
         self.lights[name] = light
@@ -150,33 +188,39 @@ class SpecialEffect:
         )
 
     def add_light_color(self, name, color):
+        targets = self._get_targets(name)
+
         async def effect():
-            for light in self._get_targets(name):
-                await light.set_color(*color)
+            await asyncio.gather(*[light.set_color(*color) for light in targets])
 
         return self._add_effect(LightEffect(effect))
 
     def add_light_color_transition(
-        self, name, start_color, end_color, duration, easing_type="linear"
+        self, name, start_color, end_color, duration, easing_type="linear", fps=10
     ):
+        targets = self._get_targets(name)
+        if fps <= 0:
+            raise ValueError(f"fps must be greater than 0, not {fps}.")
+        for color in (start_color, end_color):
+            hue, saturation, value = color
+            if not (0 <= hue <= 360 and 0 <= saturation <= 100 and 0 <= value <= 100):
+                raise ValueError(f"Color transitions need HSV colors, not {color}.")
+        frames = easing.color_ramp(start_color, end_color, duration, easing_type, fps)
+
         async def effect():
-            targets = self._get_targets(name)
-            async for color in easing.interpolate_color_over_time(
-                start_color, end_color, duration, easing_type
-            ):
-                await asyncio.gather(*[light.set_color(*color) for light in targets])
+            await easing.stream_to_lights(targets, frames, fps)
 
         return self._add_effect(LightEffect(effect))
 
     def add_sound(self, sound_file, player=None):
-        player = DefaultPlayer() if player is None else player
+        player = self._get_default_player() if player is None else player
         return self._add_effect(SoundEffect(sound_file, player=player))
 
     def add_delay(self, seconds):
-        return self._add_effect(LightEffect(lambda: asyncio.sleep(seconds)))
+        return self._add_effect(DelayEffect(seconds))
 
-    def add_custom(self, func, *args, **kwargs):
-        effect = CustomEffect(func, *args, **kwargs)
+    def add_custom(self, func, *args, blocking=True, **kwargs):
+        effect = CustomEffect(func, *args, blocking=blocking, **kwargs)
         return self._add_effect(effect)
 
     def play(self):
@@ -200,12 +244,18 @@ class SpecialEffect:
         return self
 
     def _create_light_effect(self, name, action):
+        targets = self._get_targets(name)
+
         async def effect():
-            for light in self._get_targets(name):
-                await getattr(light, action.value)()
+            await asyncio.gather(*[getattr(light, action.value)() for light in targets])
 
         return self._add_effect(LightEffect(effect))
 
+    def _get_default_player(self):
+        if self._default_player is None:
+            self._default_player = DefaultPlayer()
+        return self._default_player
+
     def _get_targets(self, name):
         targets = self.lights.get(name) or self.light_groups.get(name)
         if targets is None:
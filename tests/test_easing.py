@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from specialeffects import easing
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+async def stream_with_fake_clock(monkeypatch, frames, fps, delays):
+    # delays maps a frame to how long its lights take to respond
+    clock = FakeClock()
+    sent = []
+    with monkeypatch.context() as m:
+        m.setattr(asyncio, "get_running_loop", lambda: clock)
+        m.setattr(asyncio, "sleep", clock.sleep)
+        async for frame in easing.stream_over_time(frames, fps):
+            sent.append((frame, clock.now))
+            clock.now += delays.get(frame, 0)
+    return sent, clock.now
+
+
+@pytest.mark.asyncio
+async def test_stream_over_time_keeps_cadence(monkeypatch):
+    sent, end = await stream_with_fake_clock(monkeypatch, list(range(8)), 4, {})
+
+    assert sent == [(frame, frame * 0.25) for frame in range(8)]
+    assert end == 1.75
+
+
+@pytest.mark.asyncio
+async def test_stream_over_time_skips_late_frames(monkeypatch):
+    sent, end = await stream_with_fake_clock(monkeypatch, list(range(8)), 4, {2: 0.6})
+
+    assert sent == [(0, 0), (1, 0.25), (2, 0.5), (5, 1.25), (6, 1.5), (7, 1.75)]
+    assert end == 1.75
+
+
+@pytest.mark.asyncio
+async def test_stream_over_time_always_sends_final_frame(monkeypatch):
+    sent, end = await stream_with_fake_clock(monkeypatch, list(range(8)), 4, {5: 1})
+
+    assert sent == [
+        (0, 0),
+        (1, 0.25),
+        (2, 0.5),
+        (3, 0.75),
+        (4, 1),
+        (5, 1.25),
+        (7, 2.25),
+    ]
+    assert end == 2.25
+
+
+@pytest.mark.parametrize(
+    "start_h, end_h, progress, expected_h",
+    [
+        (350, 10, 0.5, 0),
+        (10, 350, 0.5, 0),
+        (350, 10, 0.25, 355),
+        (0, 240, 0.5, 300),
+        (240, 0, 0.5, 300),
+    ],
+)
+def test_interpolate_color_takes_shorter_hue_arc(start_h, end_h, progress, expected_h):
+    color = easing.interpolate_color((start_h, 100, 100), (end_h, 100, 100), progress)
+
+    assert color == (expected_h, 100, 100)
+
+
+@pytest.mark.parametrize("start_h, end_h, expected_h", [(0, 180, 90), (180, 0, 270)])
+def test_interpolate_color_goes_forwards_on_opposite_hues(start_h, end_h, expected_h):
+    color = easing.interpolate_color((start_h, 100, 100), (end_h, 100, 100), 0.5)
+
+    assert color == (expected_h, 100, 100)
+
+
+def test_interpolate_color_rounds_to_nearest():
+    assert easing.interpolate_color((0, 0, 0), (0, 100, 100), 0.996) == (0, 100, 100)
+    assert easing.interpolate_color((0, 0, 0), (10, 10, 10), 0.44) == (4, 4, 4)
+    assert easing.interpolate_color((0, 0, 0), (10, 10, 10), 0.46) == (5, 5, 5)
+
+
+def test_interpolate_color_wraps_rounded_hue_to_zero():
+    assert easing.interpolate_color((359, 100, 100), (1, 100, 100), 0.3) == (
+        0,
+        100,
+        100,
+    )
+
+
+@pytest.mark.parametrize("duration, fps", [(1, 1), (1, 2), (1.5, 1), (2, 10)])
+def test_color_ramp_ends_on_end_color(duration, fps):
+    frames = easing.color_ramp((0, 100, 100), (100, 0, 0), duration, "linear", fps)
+
+    assert frames[0] == (0, 100, 100)
+    assert frames[-1] == (100, 0, 0)
+
+
+def test_color_ramp_with_no_duration_jumps_to_end_color():
+    assert easing.color_ramp((0, 100, 100), (100, 0, 0), 0) == ((100, 0, 0),)
+
+
+def test_color_ramp_steps_evenly_to_end_color():
+    frames = easing.color_ramp((0, 100, 100), (100, 0, 0), 1, "linear", 2)
+
+    assert frames == ((0, 100, 100), (50, 50, 50), (100, 0, 0))
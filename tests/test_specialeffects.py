@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from specialeffects import SpecialEffect
+
+
+class FakeLight:
+    def __init__(self):
+        self.colors = []
+
+    async def turn_on(self):
+        pass
+
+    async def turn_off(self):
+        pass
+
+    async def set_color(self, hue, saturation, value):
+        self.colors.append((hue, saturation, value))
+
+
+def test_color_transition_rejects_non_positive_fps():
+    effect = SpecialEffect().add_light("light", FakeLight())
+
+    with pytest.raises(ValueError):
+        effect.add_light_color_transition(
+            "light", (0, 100, 100), (90, 100, 100), 1, fps=0
+        )
+
+
+class SlowLight(FakeLight):
+    def __init__(self, latency):
+        super().__init__()
+        self.latency = latency
+        self.sent_at = []
+
+    async def set_color(self, hue, saturation, value):
+        await asyncio.sleep(self.latency)
+        await super().set_color(hue, saturation, value)
+        self.sent_at.append(asyncio.get_running_loop().time())
+
+
+@pytest.mark.asyncio
+async def test_slow_light_does_not_hold_back_color_transition():
+    fast, slow = SlowLight(0), SlowLight(0.35)
+    effect = (
+        SpecialEffect()
+        .add_light("fast", fast)
+        .add_light("slow", slow)
+        .add_light_group("both", "fast", "slow")
+        .add_light_color_transition("both", (0, 100, 100), (100, 100, 100), 1)
+    )
+    frames = [(hue, 100, 100) for hue in range(0, 110, 10)]
+
+    start = asyncio.get_running_loop().time()
+    await effect._play_async()
+    elapsed = asyncio.get_running_loop().time() - start
+
+    # The fast light sees every frame on time
+    assert fast.colors == frames
+    assert fast.sent_at[-1] - start < 1 + 0.05
+
+    # The slow light skips frames, but keeps their order and ends on the end color
+    assert slow.colors == sorted(slow.colors)
+    assert set(slow.colors) < set(frames)
+    assert fast.colors[-1] == slow.colors[-1] == (100, 100, 100)
+
+    # Only the slow light's last two sends can run past the transition
+    assert elapsed < 1 + 2 * 0.35 + 0.1
+
+
+def test_color_transition_skips_repeated_colors():
+    light = FakeLight()
+    effect = (
+        SpecialEffect()
+        .add_light("light", light)
+        .add_light_color_transition("light", (0, 100, 100), (3, 100, 100), 1)
+    )
+
+    effect.play()
+
+    assert light.colors == [(hue, 100, 100) for hue in range(4)]
+
+
+def test_parallel_section_flattens_nested_parallel_sections():
+    effect = (
+        SpecialEffect()
+        .add_light("light1", FakeLight())
+        .add_light("light2", FakeLight())
+    )
+
+    with effect.section(parallel=True):
+        with effect.section(parallel=True):
+            effect.add_light_on("light1")
+            with effect.section(parallel=True):
+                effect.add_light_on("light2")
+        effect.add_delay(0.1)
+
+    outer = effect.effects[0]
+    middle = outer.effects[0]
+    inner = middle.effects[1]
+
+    assert outer._collect_parallel_leaves() == [
+        middle.effects[0],
+        inner.effects[0],
+        outer.effects[1],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parallel_section_runs_nested_sequential_sections_in_order():
+    light1, light2 = SlowLight(0), SlowLight(0)
+    effect = SpecialEffect().add_light("light1", light1).add_light("light2", light2)
+    red, blue = (0, 100, 100), (240, 100, 100)
+
+    with effect.section(parallel=True):
+        with effect.section("red_to_blue"):
+            effect.add_light_color("light1", red)
+            effect.add_delay(0.1)
+            effect.add_light_color("light1", blue)
+
+        with effect.section("blue_to_red"):
+            effect.add_light_color("light2", blue)
+            effect.add_delay(0.1)
+            effect.add_light_color("light2", red)
+
+    outer = effect.effects[0]
+    assert outer._collect_parallel_leaves() == outer.effects
+
+    start = asyncio.get_running_loop().time()
+    await effect._play_async()
+
+    assert light1.colors == [red, blue]
+    assert light2.colors == [blue, red]
+    for light in (light1, light2):
+        first, second = (sent_at - start for sent_at in light.sent_at)
+        assert first < 0.05
+        assert 0.1 <= second < 0.15
+
+
+@pytest.mark.asyncio
+async def test_parallel_section_runs_repeating_nested_section_as_a_unit():
+    light = FakeLight()
+    effect = SpecialEffect().add_light("light", light)
+    red = (0, 100, 100)
+
+    with effect.section(parallel=True):
+        with effect.section(parallel=True, repeat=2):
+            effect.add_light_color("light", red)
+
+    outer = effect.effects[0]
+    assert outer._collect_parallel_leaves() == [outer.effects[0]]
+
+    await effect._play_async()
+
+    assert light.colors == [red, red]
+
+
+@pytest.mark.parametrize(
+    "start_color, end_color",
+    [((0, 128, 255), (0, 0, 0)), ((0, 100, 100), (400, 100, 100))],
+)
+def test_color_transition_rejects_non_hsv_colors(start_color, end_color):
+    effect = SpecialEffect().add_light("light", FakeLight())
+
+    with pytest.raises(ValueError):
+        effect.add_light_color_transition("light", start_color, end_color, 1)